@@ -8,11 +8,16 @@ with files in each folder also sorted by error count.
 
 import os
 import re
-from collections import defaultdict
+import sys
+from collections import Counter, defaultdict
 
 # Path to the ESLint report file
 REPORT_FILE = 'eslint_report.txt'
 
+# Regular expression to match file paths in the report, compiled once and
+# applied to the whole buffer in a single multiline pass
+FILE_PATTERN = re.compile(rb'^[ \t]*(.+?):\s+line\s+\d+,\s+col\s+\d+,\s+(Error|Warning)\s+-', re.MULTILINE)
+
 def parse_eslint_report(file_path):
     """
     Parse the ESLint report file and organize issues by folder and file.
@@ -21,82 +26,92 @@ def parse_eslint_report(file_path):
         file_path: Path to the ESLint report file
         
     Returns:
-        A dictionary with folder paths as keys and a dictionary of files and their error counts as values
+        A Counter keyed by (folder path, file path) with error counts as values
     """
     # Check if the report file exists
     if not os.path.exists(file_path):
         print(f"Error: Report file '{file_path}' not found.")
-        return {}
-    
-    # Dictionary to store error counts by folder and file
-    folder_file_errors = defaultdict(lambda: defaultdict(int))
-    
-    # Regular expression to match file paths in the report
-    file_pattern = re.compile(r'^(.+?):\s+line\s+\d+,\s+col\s+\d+,\s+(Error|Warning)\s+-')
-    
+        return Counter()
+
+    # Flat counter keyed by (folder, file); a single hash per increment
+    # instead of the nested defaultdict's two lookups
+    error_counts = Counter()
+
+    # A file with many issues appears on many lines; cache its folder path
+    # instead of re-deriving it per line
+    folder_cache = {}
+
     try:
-        with open(file_path, 'r') as f:
-            for line in f:
-                match = file_pattern.match(line.strip())
-                if match:
-                    file_path = match.group(1)
-                    issue_type = match.group(2)
-                    
-                    # Get the folder path from the file path
-                    folder_path = os.path.dirname(file_path)
-                    
-                    # Increment the error count for this file
-                    folder_file_errors[folder_path][file_path] += 1
+        # Read the whole report and let the regex engine iterate the matches
+        # in C instead of looping over lines in Python
+        with open(file_path, 'rb') as f:
+            buf = f.read()
     except Exception as e:
         print(f"Error reading report file: {e}")
-        return {}
-    
-    return folder_file_errors
+        return Counter()
+
+    for match in FILE_PATTERN.finditer(buf):
+        report_path = match.group(1).decode()
+
+        # Get the folder path from the file path
+        folder_path = folder_cache.get(report_path)
+        if folder_path is None:
+            folder_path = folder_cache[report_path] = os.path.dirname(report_path)
 
-def display_sorted_results(folder_file_errors):
+        # Increment the error count for this file
+        error_counts[(folder_path, report_path)] += 1
+
+    return error_counts
+
+def display_sorted_results(error_counts):
     """
     Display folders sorted by error count, with files in each folder also sorted by error count.
-    
+
     Args:
-        folder_file_errors: Dictionary with folder paths as keys and dictionaries of files and their error counts as values
+        error_counts: Counter keyed by (folder path, file path) with error counts as values
     """
-    if not folder_file_errors:
+    if not error_counts:
         print("No ESLint issues found or could not parse the report.")
         return
-    
-    # Calculate total errors per folder
-    folder_errors = {}
-    for folder, files in folder_file_errors.items():
-        folder_errors[folder] = sum(files.values())
-    
+
+    # Aggregate folder totals and group files per folder in one linear pass
+    folder_errors = Counter()
+    files_by_folder = defaultdict(Counter)
+    for (folder, file_path), count in error_counts.items():
+        folder_errors[folder] += count
+        files_by_folder[folder][file_path] += count
+
     # Sort folders by error count (descending)
-    sorted_folders = sorted(folder_errors.items(), key=lambda x: x[1], reverse=True)
-    
-    print("\nESLint Issues by Folder (sorted by error count):\n")
-    print("-" * 80)
+    sorted_folders = folder_errors.most_common()
     
+    # Collect the report in memory and emit it with a single write instead of
+    # one line-buffered print per row
+    out = []
+    out.append("\nESLint Issues by Folder (sorted by error count):\n")
+    out.append("-" * 80)
+
     for folder, error_count in sorted_folders:
         # Get a shorter folder name for display
         short_folder = os.path.basename(folder) or folder
-        
-        print(f"\n{short_folder} ({error_count} issues)")
-        print("-" * 40)
-        
+
+        out.append(f"\n{short_folder} ({error_count} issues)")
+        out.append("-" * 40)
+
         # Sort files in this folder by error count (descending)
-        sorted_files = sorted(folder_file_errors[folder].items(), key=lambda x: x[1], reverse=True)
-        
-        for file_path, file_error_count in sorted_files:
+        for file_path, file_error_count in files_by_folder[folder].most_common():
             # Get just the filename for display
             filename = os.path.basename(file_path)
-            print(f"  {filename}: {file_error_count} issues")
+            out.append(f"  {filename}: {file_error_count} issues")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     """
     Main function to run the ESLint report analysis.
     """
     print("Analyzing ESLint report...")
-    folder_file_errors = parse_eslint_report(REPORT_FILE)
-    display_sorted_results(folder_file_errors)
+    error_counts = parse_eslint_report(REPORT_FILE)
+    display_sorted_results(error_counts)
     print("\nAnalysis complete.")
 
 if __name__ == "__main__":
@@ -13,10 +13,27 @@ Usage:
 import json
 import os
 import re
+import subprocess
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
 from pathlib import Path
 
+# Prefer orjson's C parser for multi-MB reports; fall back to stdlib json
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Stream the report record by record when ijson is available, so peak memory
+# is bounded by one file entry instead of the whole report
+try:
+    import ijson
+    _JSON_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (ValueError,)
+
 # ANSI color codes for terminal output
 COLORS = {
     "HEADER": "\033[95m",
@@ -31,105 +48,143 @@ COLORS = {
 }
 
 def generate_eslint_report():
-    """Generate a fresh ESLint report if one doesn't exist"""
-    if not os.path.exists('eslint_report.json'):
-        print(f"{COLORS['YELLOW']}No ESLint report found. Generating a new one...{COLORS['ENDC']}")
-        os.system('npx eslint --format json src/ > eslint_report.json')
-        print(f"{COLORS['GREEN']}ESLint report generated.{COLORS['ENDC']}")
-
-def parse_eslint_report():
-    """Parse the ESLint report and organize issues by directory and file"""
+    """Generate a fresh ESLint report if one doesn't exist
+
+    Returns the parsed report, or None when a cached eslint_report.json is
+    present so the parser can stream it from disk. Pass --write to also
+    save the fresh report to eslint_report.json.
+    """
+    if os.path.exists('eslint_report.json'):
+        return None
+
+    print(f"{COLORS['YELLOW']}No ESLint report found. Generating a new one...{COLORS['ENDC']}")
+    # Pipe the JSON straight into the parser instead of routing it through
+    # a shell redirect and re-reading it from disk
+    result = subprocess.run(
+        ['npx', 'eslint', '--format', 'json', 'src/'],
+        stdout=subprocess.PIPE,
+        check=False
+    )
+
+    if '--write' in sys.argv:
+        with open('eslint_report.json', 'wb') as f:
+            f.write(result.stdout)
+
+    print(f"{COLORS['GREEN']}ESLint report generated.{COLORS['ENDC']}")
     try:
-        with open('eslint_report.json', 'r') as f:
-            report = json.load(f)
+        return _loads(result.stdout)
+    except ValueError:
+        print(f"{COLORS['RED']}Error: ESLint did not produce valid JSON.{COLORS['ENDC']}")
+        sys.exit(1)
+
+def _iter_file_reports():
+    """Yield top-level file records from eslint_report.json one at a time"""
+    with open('eslint_report.json', 'rb') as f:
+        if ijson is not None:
+            yield from ijson.items(f, 'item')
+        else:
+            yield from _loads(f.read())
+
+def parse_eslint_report(report=None):
+    """Parse the ESLint report and organize issues by directory and file
+
+    Accepts an already-parsed report (fresh from ESLint's stdout); when
+    None, the cached eslint_report.json is read instead.
+    """
+    # Flat counter keyed by (directory, filename, rule_id); the hierarchical
+    # view is derived at display time
+    issue_counts = Counter()
+    rule_counts = Counter()
+    total_issues = 0
+
+    try:
+        for file_report in (report if report is not None else _iter_file_reports()):
+            if not file_report.get('messages'):
+                continue
+
+            filepath = file_report['filePath']
+            rel_path = os.path.relpath(filepath)
+            directory = os.path.dirname(rel_path)
+            filename = os.path.basename(rel_path)
+
+            # Count issues by rule for this file, writing straight into the
+            # flat counter with the path parts computed once per file above
+            for message in file_report['messages']:
+                rule_id = message.get('ruleId', 'unknown')
+                issue_counts[(directory, filename, rule_id)] += 1
+                rule_counts[rule_id] += 1
+                total_issues += 1
     except FileNotFoundError:
         print(f"{COLORS['RED']}Error: eslint_report.json not found.{COLORS['ENDC']}")
         sys.exit(1)
-    except json.JSONDecodeError:
+    except _JSON_ERRORS:
         print(f"{COLORS['RED']}Error: eslint_report.json is not valid JSON.{COLORS['ENDC']}")
         sys.exit(1)
 
-    # Organize issues by directory and file
-    issues_by_dir = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
-    rule_counts = defaultdict(int)
-    total_issues = 0
-
-    for file_report in report:
-        if not file_report.get('messages'):
-            continue
-
-        filepath = file_report['filePath']
-        rel_path = os.path.relpath(filepath)
-        directory = os.path.dirname(rel_path)
-        filename = os.path.basename(rel_path)
+    return issue_counts, rule_counts, total_issues
 
-        # Count issues by rule for this file
-        file_issues = defaultdict(int)
-        for message in file_report['messages']:
-            rule_id = message.get('ruleId', 'unknown')
-            file_issues[rule_id] += 1
-            rule_counts[rule_id] += 1
-            total_issues += 1
+def display_analysis(issue_counts, rule_counts, total_issues):
+    """Display the analysis results in a clear, hierarchical format
 
-        # Store file issues in the directory structure
-        for rule_id, count in file_issues.items():
-            issues_by_dir[directory][filename][rule_id] = count
+    Returns the directory with the most issues, or None if there are none
+    """
+    # Collect the report in memory and emit it with a single write instead of
+    # one line-buffered print per row
+    out = []
+    out.append(f"\n{COLORS['HEADER']}{COLORS['BOLD']}ESLint Issues Analysis{COLORS['ENDC']}")
+    out.append(f"{COLORS['BOLD']}Total Issues: {total_issues}{COLORS['ENDC']}\n")
 
-    return issues_by_dir, rule_counts, total_issues
+    # Derive directory and file totals from the flat counter in one pass
+    dir_totals = Counter()
+    files_by_dir = defaultdict(Counter)
+    rules_by_file = defaultdict(Counter)
+    for (directory, filename, rule_id), count in issue_counts.items():
+        dir_totals[directory] += count
+        files_by_dir[directory][filename] += count
+        rules_by_file[(directory, filename)][rule_id] += count
 
-def display_analysis(issues_by_dir, rule_counts, total_issues):
-    """Display the analysis results in a clear, hierarchical format"""
-    print(f"\n{COLORS['HEADER']}{COLORS['BOLD']}ESLint Issues Analysis{COLORS['ENDC']}")
-    print(f"{COLORS['BOLD']}Total Issues: {total_issues}{COLORS['ENDC']}\n")
-
-    # Sort directories by total issue count
-    dir_totals = {}
-    for directory, files in issues_by_dir.items():
-        dir_total = sum(sum(rules.values()) for rules in files.values())
-        dir_totals[directory] = dir_total
-
-    sorted_dirs = sorted(dir_totals.items(), key=lambda x: x[1], reverse=True)
+    # Directories sorted by total issue count
+    sorted_dirs = dir_totals.most_common()
 
     # Display issues by directory and file
     for directory, dir_total in sorted_dirs:
         dir_percent = (dir_total / total_issues) * 100
-        print(f"{COLORS['BOLD']}{COLORS['BLUE']}Directory: {directory} - {dir_total} issues ({dir_percent:.1f}%){COLORS['ENDC']}")
+        out.append(f"{COLORS['BOLD']}{COLORS['BLUE']}Directory: {directory} - {dir_total} issues ({dir_percent:.1f}%){COLORS['ENDC']}")
 
         # Sort files by issue count
-        files = issues_by_dir[directory]
-        file_totals = {filename: sum(rules.values()) for filename, rules in files.items()}
-        sorted_files = sorted(file_totals.items(), key=lambda x: x[1], reverse=True)
-
-        for filename, file_total in sorted_files:
+        for filename, file_total in files_by_dir[directory].most_common():
             file_percent = (file_total / dir_total) * 100
-            print(f"  {COLORS['CYAN']}{filename} - {file_total} issues ({file_percent:.1f}%){COLORS['ENDC']}")
+            out.append(f"  {COLORS['CYAN']}{filename} - {file_total} issues ({file_percent:.1f}%){COLORS['ENDC']}")
 
             # Show top rules for this file
-            rules = issues_by_dir[directory][filename]
-            sorted_rules = sorted(rules.items(), key=lambda x: x[1], reverse=True)
-            for rule_id, count in sorted_rules[:5]:  # Show top 5 rules
-                print(f"    {COLORS['YELLOW']}{rule_id}: {count} issues{COLORS['ENDC']}")
-            
-            if len(sorted_rules) > 5:
-                print(f"    {COLORS['YELLOW']}...and {len(sorted_rules) - 5} more rule types{COLORS['ENDC']}")
-        
-        print()  # Add a blank line between directories
+            rules = rules_by_file[(directory, filename)]
+            for rule_id, count in rules.most_common(5):  # Show top 5 rules
+                out.append(f"    {COLORS['YELLOW']}{rule_id}: {count} issues{COLORS['ENDC']}")
+
+            if len(rules) > 5:
+                out.append(f"    {COLORS['YELLOW']}...and {len(rules) - 5} more rule types{COLORS['ENDC']}")
+
+        out.append("")  # Add a blank line between directories
 
     # Display top rules overall
-    print(f"{COLORS['BOLD']}Top ESLint Rules:{COLORS['ENDC']}")
-    sorted_rules = sorted(rule_counts.items(), key=lambda x: x[1], reverse=True)
-    for rule_id, count in sorted_rules[:10]:  # Show top 10 rules
+    out.append(f"{COLORS['BOLD']}Top ESLint Rules:{COLORS['ENDC']}")
+    for rule_id, count in rule_counts.most_common(10):  # Show top 10 rules
         rule_percent = (count / total_issues) * 100
-        print(f"  {COLORS['YELLOW']}{rule_id}: {count} issues ({rule_percent:.1f}%){COLORS['ENDC']}")
+        out.append(f"  {COLORS['YELLOW']}{rule_id}: {count} issues ({rule_percent:.1f}%){COLORS['ENDC']}")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+    return sorted_dirs[0][0] if sorted_dirs else None
 
 def main():
     """Main function to run the analysis"""
-    generate_eslint_report()
-    issues_by_dir, rule_counts, total_issues = parse_eslint_report()
-    display_analysis(issues_by_dir, rule_counts, total_issues)
-    
+    report = generate_eslint_report()
+    issue_counts, rule_counts, total_issues = parse_eslint_report(report)
+    worst_dir = display_analysis(issue_counts, rule_counts, total_issues)
+
     print(f"\n{COLORS['GREEN']}Analysis complete. Use this information to prioritize which directories to fix first.{COLORS['ENDC']}")
-    print(f"{COLORS['GREEN']}Recommended next step: ./scripts/fix-directory.sh {list(issues_by_dir.keys())[0]}{COLORS['ENDC']}")
+    if worst_dir:
+        print(f"{COLORS['GREEN']}Recommended next step: ./scripts/fix-directory.sh {worst_dir}{COLORS['ENDC']}")
 
 if __name__ == "__main__":
     main()
@@ -11,20 +11,31 @@ import subprocess
 import json
 from pathlib import Path
 
+# Prefer orjson's C parser for multi-MB reports; fall back to stdlib json
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Get the root directory of the project
 ROOT_DIR = Path(__file__).parent.parent
 
+# Matches identifiers already prefixed with underscore
+_PREFIXED_IDENT = re.compile(r'\b_(\w+)\b')
+
 def get_eslint_issues():
     """Run ESLint and get the list of unused variables issues."""
+    # Keep stdout as bytes; both orjson and json parse bytes directly, so
+    # there is no need to decode the whole report first
     result = subprocess.run(
         ['npx', 'eslint', '--format', 'json', 'src/**/*.ts'],
-        capture_output=True,
-        text=True
+        capture_output=True
     )
-    
+
     try:
-        eslint_output = json.loads(result.stdout)
-    except json.JSONDecodeError:
+        eslint_output = _loads(result.stdout)
+    except ValueError:
         print("Error parsing ESLint output")
         return []
     
@@ -64,47 +75,62 @@ def fix_unused_vars(issues):
             
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
-        
+
+        # Collect identifiers already prefixed with underscore in one pass,
+        # then skip those variables; the old substring check rescanned the
+        # whole file per variable and matched unrelated identifiers that
+        # merely contained '_name'
+        already = {m.group(1) for m in _PREFIXED_IDENT.finditer(content)}
+        variables = [v for v in variables if v not in already]
+        if not variables:
+            continue
+
+        # Build one alternation over all target variables so each declaration
+        # pattern scans the file once instead of once per variable. ESLint
+        # reports plain JS identifiers, which contain no regex metacharacters,
+        # so re.escape is only needed for the odd name that isn't one.
+        alt = '(?:' + '|'.join(v if v.isidentifier() else re.escape(v) for v in variables) + ')'
+
+        # Handle different variable declaration patterns. In list-like
+        # contexts (parameter lists, destructuring, import braces) matches
+        # can sit back to back, so those kinds keep the trailing delimiter
+        # as a lookahead instead of consuming it, and guard the variable
+        # with a lookbehind so a name cannot be prefixed twice.
+        patterns = [
+            # Regular variable declarations
+            (re.compile(r'(const|let|var)\s+(' + alt + r')(\s*[:=]|\s+in\s+|\s+of\s+)'), r'\1 _\2\3'),
+            # Function parameters
+            (re.compile(r'(\(|,\s*)(' + alt + r')(?=\s*[:),])'), r'\1_\2'),
+            # Destructuring assignments
+            (re.compile(r'(\{[^}]*?)(?<!\w)(' + alt + r')(?=\s*[,}])'), r'\1_\2'),
+            # Function declarations
+            (re.compile(r'(function\s+)(' + alt + r')(\s*\()'), r'\1_\2\3'),
+            # Import statements
+            (re.compile(r'(import\s+\{[^}]*?)(?<!\w)(' + alt + r')(?=\s*[,}])'), r'\1_\2'),
+            (re.compile(r'(import\s+)(' + alt + r')(\s+from)'), r'\1_\2\3'),
+            # Class properties
+            (re.compile(r'(private|protected|public)\s+(' + alt + r')(\s*[:=])'), r'\1 _\2\3'),
+            # Arrow function parameters
+            (re.compile(r'(\(\s*)(' + alt + r')(\s*\)\s*=>)'), r'\1_\2\3'),
+            # Method parameters
+            (re.compile(r'(method\([^)]*?)(?<!\w)(' + alt + r')(?=\s*[,)])'), r'\1_\2'),
+        ]
+
         modified_content = content
-        file_modified = False
-        
-        # Process each variable in the file
-        for variable in variables:
-            # Skip if the variable is already prefixed with underscore
-            if f'_{variable}' in modified_content:
-                continue
-                
-            # Handle different variable declaration patterns
-            patterns = [
-                # Regular variable declarations
-                (re.compile(r'(const|let|var)\s+(' + re.escape(variable) + r')(\s*[:=]|\s+in\s+|\s+of\s+)'), r'\1 _\2\3'),
-                # Function parameters
-                (re.compile(r'(\(|,\s*)(' + re.escape(variable) + r')(\s*[:),])'), r'\1_\2\3'),
-                # Destructuring assignments
-                (re.compile(r'(\{[^}]*?)(' + re.escape(variable) + r')(\s*[,}])'), r'\1_\2\3'),
-                # Function declarations
-                (re.compile(r'(function\s+)(' + re.escape(variable) + r')(\s*\()'), r'\1_\2\3'),
-                # Import statements
-                (re.compile(r'(import\s+\{[^}]*?)(' + re.escape(variable) + r')(\s*[,}])'), r'\1_\2\3'),
-                (re.compile(r'(import\s+)(' + re.escape(variable) + r')(\s+from)'), r'\1_\2\3'),
-                # Class properties
-                (re.compile(r'(private|protected|public)\s+(' + re.escape(variable) + r')(\s*[:=])'), r'\1 _\2\3'),
-                # Arrow function parameters
-                (re.compile(r'(\(\s*)(' + re.escape(variable) + r')(\s*\)\s*=>)'), r'\1_\2\3'),
-                # Method parameters
-                (re.compile(r'(method\([^)]*?)(' + re.escape(variable) + r')(\s*[,)])'), r'\1_\2\3'),
-            ]
-            
-            for pattern, replacement in patterns:
-                modified_content = pattern.sub(replacement, modified_content)
-            
-            # Check if the variable was actually modified
-            if modified_content != content:
-                file_modified = True
-                print(f"Fixed unused variable '{variable}' in {file_path}")
-        
+        fixes = 0
+        for pattern, replacement in patterns:
+            # The lazy brace/paren prefixes only re-anchor at their opening
+            # character, so repeat each kind until it stops matching; the
+            # lookbehind guard keeps the repeats from re-prefixing a name
+            while True:
+                modified_content, count = pattern.subn(replacement, modified_content)
+                if not count:
+                    break
+                fixes += count
+
         # Write the modified content back to the file
-        if file_modified:
+        if fixes:
+            print(f"Fixed {fixes} unused variable declarations in {file_path}")
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(modified_content)
             files_modified.add(file_path)
@@ -19,6 +19,7 @@ import os
 import re
 import sys
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional, Union
 
@@ -35,6 +36,41 @@ COLORS = {
     "UNDERLINE": "\033[4m"
 }
 
+# Patterns and replacements for common 'any' use cases, compiled once at import
+_ANY_REPLACEMENTS = [
+    # Function parameters and return types
+    (re.compile(r'\((\w+)\s*:\s*any\)'), r'(\1: unknown)'),
+    (re.compile(r'\((\w+)\s*:\s*any\[\]\)'), r'(\1: unknown[])'),
+    (re.compile(r'\)\s*:\s*any\s*\{'), r'): unknown {'),
+    (re.compile(r'\)\s*:\s*any\[\]\s*\{'), r'): unknown[] {'),
+
+    # Variable declarations
+    (re.compile(r'(const|let|var)\s+(\w+)\s*:\s*any\s*='), r'\1 \2: unknown ='),
+    (re.compile(r'(const|let|var)\s+(\w+)\s*:\s*any\[\]\s*='), r'\1 \2: unknown[] ='),
+
+    # Interface and type properties
+    (re.compile(r'(\w+)\??:\s*any;'), r'\1?: unknown;'),
+    (re.compile(r'(\w+)\??:\s*any\[\];'), r'\1?: unknown[];'),
+
+    # Generic types
+    (re.compile(r'<any>'), r'<unknown>'),
+    (re.compile(r'<any\[\]>'), r'<unknown[]>'),
+
+    # Record types for objects
+    (re.compile(r'Record<string,\s*any>'), r'Record<string, unknown>'),
+    (re.compile(r'Record<number,\s*any>'), r'Record<number, unknown>'),
+
+    # Special case for handlebars.d.ts and similar definition files
+    # For function parameters that accept multiple types
+    (re.compile(r'(\w+\??:\s*)any(\s*,)'), r'\1unknown\2'),
+
+    # Special case for context objects
+    (re.compile(r'context\??:\s*any'), r'context?: Record<string, unknown>'),
+    (re.compile(r'options\??:\s*any'), r'options?: Record<string, unknown>'),
+    (re.compile(r'data\??:\s*any'), r'data?: Record<string, unknown>'),
+    (re.compile(r'hash\??:\s*any'), r'hash?: Record<string, unknown>')
+]
+
 def run_eslint(directory: str) -> List[Dict]:
     """Run ESLint on the specified directory and return the JSON report"""
     print(f"{COLORS['BLUE']}Running ESLint on {directory}...{COLORS['ENDC']}")
@@ -53,110 +89,55 @@ def run_eslint(directory: str) -> List[Dict]:
         print(f"{COLORS['RED']}Error parsing ESLint output{COLORS['ENDC']}")
         sys.exit(1)
 
-def fix_no_explicit_any(file_path: str) -> int:
-    """Fix @typescript-eslint/no-explicit-any issues in the file
-    
-    Returns the number of fixes applied
+def run_eslint_once(directory: str) -> Dict[str, List[Dict]]:
+    """Run ESLint once over the whole directory and index the messages by file
+
+    Returns a dictionary mapping absolute file paths to their message lists
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Define patterns and replacements for common 'any' use cases
-    replacements = [
-        # Function parameters and return types
-        (r'\((\w+)\s*:\s*any\)', r'(\1: unknown)'),
-        (r'\((\w+)\s*:\s*any\[\]\)', r'(\1: unknown[])'),
-        (r'\)\s*:\s*any\s*\{', r'): unknown {'),
-        (r'\)\s*:\s*any\[\]\s*\{', r'): unknown[] {'),
-        
-        # Variable declarations
-        (r'(const|let|var)\s+(\w+)\s*:\s*any\s*=', r'\1 \2: unknown ='),
-        (r'(const|let|var)\s+(\w+)\s*:\s*any\[\]\s*=', r'\1 \2: unknown[] ='),
-        
-        # Interface and type properties
-        (r'(\w+)\??:\s*any;', r'\1?: unknown;'),
-        (r'(\w+)\??:\s*any\[\];', r'\1?: unknown[];'),
-        
-        # Generic types
-        (r'<any>', r'<unknown>'),
-        (r'<any\[\]>', r'<unknown[]>'),
-        
-        # Record types for objects
-        (r'Record<string,\s*any>', r'Record<string, unknown>'),
-        (r'Record<number,\s*any>', r'Record<number, unknown>'),
-        
-        # Special case for handlebars.d.ts and similar definition files
-        # For function parameters that accept multiple types
-        (r'(\w+\??:\s*)any(\s*,)', r'\1unknown\2'),
-        
-        # Special case for context objects
-        (r'context\??:\s*any', r'context?: Record<string, unknown>'),
-        (r'options\??:\s*any', r'options?: Record<string, unknown>'),
-        (r'data\??:\s*any', r'data?: Record<string, unknown>'),
-        (r'hash\??:\s*any', r'hash?: Record<string, unknown>')
-    ]
-    
-    # Apply all replacements
-    fixed_content = content
+    report = run_eslint(directory)
+
+    messages_by_file: Dict[str, List[Dict]] = {}
+    for file_report in report:
+        if not file_report.get('messages'):
+            continue
+        messages_by_file[os.path.abspath(file_report['filePath'])] = file_report['messages']
+
+    return messages_by_file
+
+def _apply_any_fixes(content: str) -> Tuple[str, int]:
+    """Fix @typescript-eslint/no-explicit-any issues in the content
+
+    Returns the fixed content and the number of fixes applied
+    """
+    # Fast path: every replacement pattern requires the literal 'any', so a
+    # plain substring test lets most files skip the regex passes entirely
+    if 'any' not in content:
+        return content, 0
+
     fixes = 0
-    
-    for pattern, replacement in replacements:
-        new_content, count = re.subn(pattern, replacement, fixed_content)
+    for pattern, replacement in _ANY_REPLACEMENTS:
+        content, count = pattern.subn(replacement, content)
         fixes += count
-        fixed_content = new_content
-    
-    # Only write to the file if changes were made
-    if fixes > 0:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
-        print(f"{COLORS['GREEN']}Fixed {fixes} 'no-explicit-any' issues in {file_path}{COLORS['ENDC']}")
-    
-    return fixes
 
-def fix_unused_vars(file_path: str) -> int:
-    """Fix @typescript-eslint/no-unused-vars issues in the file by prefixing with underscore
-    
-    Returns the number of fixes applied
+    return content, fixes
+
+def _apply_unused_var_fixes(lines: List[str], messages: List[Dict]) -> int:
+    """Fix @typescript-eslint/no-unused-vars issues by prefixing with underscore
+
+    Mutates the line list in place and returns the number of fixes applied
     """
-    # Run ESLint on the specific file to get unused variables
-    try:
-        result = subprocess.run(
-            ["npx", "eslint", "--format", "json", file_path],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        report = json.loads(result.stdout)
-    except (subprocess.CalledProcessError, json.JSONDecodeError):
-        print(f"{COLORS['RED']}Error analyzing {file_path} for unused variables{COLORS['ENDC']}")
-        return 0
-    
-    if not report or len(report) == 0:
-        return 0
-    
     # Extract unused variable names and their locations
     unused_vars = []
-    for file_report in report:
-        if not file_report.get('messages'):
-            continue
-            
-        for message in file_report['messages']:
-            if message.get('ruleId') == '@typescript-eslint/no-unused-vars':
-                # Extract variable name from the message
-                var_match = re.search(r"'(\w+)' is defined but never used", message.get('message', ''))
-                if var_match:
-                    var_name = var_match.group(1)
-                    line = message.get('line', 0)
-                    column = message.get('column', 0)
-                    unused_vars.append((var_name, line, column))
-    
-    if not unused_vars:
-        return 0
-    
-    # Read the file content
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
+    for message in messages:
+        if message.get('ruleId') == '@typescript-eslint/no-unused-vars':
+            # Extract variable name from the message
+            var_match = re.search(r"'(\w+)' is defined but never used", message.get('message', ''))
+            if var_match:
+                var_name = var_match.group(1)
+                line = message.get('line', 0)
+                column = message.get('column', 0)
+                unused_vars.append((var_name, line, column))
+
     # Process each unused variable
     fixes = 0
     for var_name, line_num, col_num in unused_vars:
@@ -169,51 +150,86 @@ def fix_unused_vars(file_path: str) -> int:
             continue
             
         line = lines[line_num - 1]
-        
+
         # Replace the variable name with prefixed version
         # We need to be careful to only replace the exact variable name at the right position
         prefix_pos = col_num - 1  # Convert to 0-based indexing
-        
-        # Ensure we're at the start of the variable name
-        if prefix_pos >= 0 and prefix_pos < len(line):
-            # Check if the character at prefix_pos is the start of the variable name
-            if line[prefix_pos:prefix_pos + len(var_name)] == var_name:
-                # Check if it's a standalone identifier (not part of a larger name)
-                is_standalone = True
-                if prefix_pos > 0 and line[prefix_pos-1].isalnum() or line[prefix_pos-1] == '_':
-                    is_standalone = False
-                if prefix_pos + len(var_name) < len(line) and (line[prefix_pos + len(var_name)].isalnum() or line[prefix_pos + len(var_name)] == '_'):
-                    is_standalone = False
-                    
-                if is_standalone:
-                    # Replace the variable name with _varName
-                    new_line = line[:prefix_pos] + '_' + line[prefix_pos:]
-                    lines[line_num - 1] = new_line
-                    fixes += 1
-    
-    # Write the modified content back to the file
-    if fixes > 0:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
-        print(f"{COLORS['GREEN']}Fixed {fixes} 'no-unused-vars' issues in {file_path}{COLORS['ENDC']}")
-    
+
+        if prefix_pos < 0 or prefix_pos >= len(line):
+            continue
+
+        # Match the variable at the reported column; the lookarounds reject
+        # occurrences inside a larger identifier
+        standalone = re.compile(rf'(?<!\w){re.escape(var_name)}(?!\w)')
+        if standalone.match(line, prefix_pos):
+            # Replace the variable name with _varName
+            lines[line_num - 1] = line[:prefix_pos] + '_' + line[prefix_pos:]
+            fixes += 1
+
     return fixes
 
+def fix_file(file_path: str, messages: List[Dict]) -> Tuple[int, int]:
+    """Apply both fix passes to the file with a single read and a single write
+
+    Returns a tuple of (any_fixes, unused_var_fixes)
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    # Prefix unused variables first, while the line/column positions from
+    # the ESLint report still match the content
+    lines = content.splitlines(keepends=True)
+    unused_var_fixes = _apply_unused_var_fixes(lines, messages)
+    if unused_var_fixes:
+        content = ''.join(lines)
+
+    # Then rewrite the 'any' usages
+    content, any_fixes = _apply_any_fixes(content)
+
+    # Only write to the file if changes were made
+    if any_fixes or unused_var_fixes:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        if any_fixes:
+            print(f"{COLORS['GREEN']}Fixed {any_fixes} 'no-explicit-any' issues in {file_path}{COLORS['ENDC']}")
+        if unused_var_fixes:
+            print(f"{COLORS['GREEN']}Fixed {unused_var_fixes} 'no-unused-vars' issues in {file_path}{COLORS['ENDC']}")
+
+    return any_fixes, unused_var_fixes
+
+def _process_file(task: Tuple[str, List[Dict]]) -> Tuple[int, int]:
+    """Worker: apply both fix passes to a single file
+
+    Returns a tuple of (any_fixes, unused_var_fixes)
+    """
+    file_path, messages = task
+    return fix_file(file_path, messages)
+
 def process_directory(directory: str) -> Tuple[int, int]:
     """Process all TypeScript files in the directory recursively
-    
+
     Returns a tuple of (any_fixes, unused_var_fixes)
     """
     any_fixes = 0
     unused_var_fixes = 0
-    
+
+    # Run ESLint once up front instead of once per file
+    messages_by_file = run_eslint_once(directory)
+
+    tasks = []
     for root, _, files in os.walk(directory):
         for file in files:
             if file.endswith('.ts') or file.endswith('.tsx') or file.endswith('.d.ts'):
                 file_path = os.path.join(root, file)
-                any_fixes += fix_no_explicit_any(file_path)
-                unused_var_fixes += fix_unused_vars(file_path)
-    
+                tasks.append((file_path, messages_by_file.get(os.path.abspath(file_path), [])))
+
+    # Files are independent after the batched ESLint run, so fan the fix
+    # passes out across cores; chunksize amortizes the IPC overhead
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for file_any_fixes, file_unused_fixes in executor.map(_process_file, tasks, chunksize=32):
+            any_fixes += file_any_fixes
+            unused_var_fixes += file_unused_fixes
+
     return any_fixes, unused_var_fixes
 
 def main():